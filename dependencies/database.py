@@ -1,5 +1,6 @@
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
 from sqlalchemy.orm import DeclarativeBase
+from dependencies.query_budget import instrument_engine
 from dotenv import load_dotenv
 from typing import AsyncGenerator
 import os
@@ -21,6 +22,9 @@ engine = create_async_engine(
     echo=True
 )
 
+# Lekérdezés-számlálás a tesztekhez (lásd QueryBudgetMiddleware)
+instrument_engine(engine.sync_engine)
+
 SessionLocal = async_sessionmaker(
     autocommit=False, autoflush=False, bind=engine, class_=AsyncSession, expire_on_commit=False
 )
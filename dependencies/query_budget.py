@@ -0,0 +1,112 @@
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Callable, Iterator, Optional
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+# Az aktuális kéréshez (vagy `track_queries` blokkhoz) tartozó napló.
+# Ha nincs beállítva, az eseménykezelők nem csinálnak semmit.
+_current_log: ContextVar[Optional["QueryLog"]] = ContextVar("query_log", default=None)
+
+
+@dataclass
+class QueryLog:
+    statements: list[str] = field(default_factory=list)
+    round_trips: int = 0
+
+    def report(self) -> str:
+        lines = [f"{len(self.statements)} SQL utasítás, {self.round_trips} adatbázis-kör:"]
+        lines += [f"  {i}. {stmt}" for i, stmt in enumerate(self.statements, start=1)]
+        return "\n".join(lines)
+
+
+@dataclass(frozen=True)
+class QueryBudget:
+    statements: int
+    round_trips: int
+
+
+class QueryBudgetExceeded(AssertionError):
+    def __init__(self, endpoint: str, budget: QueryBudget, log: QueryLog):
+        self.endpoint = endpoint
+        self.budget = budget
+        self.log = log
+        super().__init__(
+            f"A(z) {endpoint} végpont túllépte a lekérdezési keretét "
+            f"(max. {budget.statements} utasítás, {budget.round_trips} kör).\n"
+            + log.report()
+        )
+
+
+def query_budget(statements: int, round_trips: int) -> Callable:
+    """
+    Lekérdezési keretet rendel egy végponthoz. A keretet csak a
+    `QueryBudgetMiddleware` ellenőrzi, éles futásnál nincs hatása.
+    A round_trips az utasításokon felül a commitokat és rollbackeket is számolja.
+    """
+    def decorator(func: Callable) -> Callable:
+        func.__query_budget__ = QueryBudget(statements=statements, round_trips=round_trips)
+        return func
+
+    return decorator
+
+
+@contextmanager
+def track_queries() -> Iterator[QueryLog]:
+    log = QueryLog()
+    token = _current_log.set(log)
+    try:
+        yield log
+    finally:
+        _current_log.reset(token)
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    log = _current_log.get()
+    if log is None:
+        return
+    log.statements.append(statement)
+    log.round_trips += 1
+
+
+def _on_transaction_end(conn):
+    log = _current_log.get()
+    if log is not None:
+        log.round_trips += 1
+
+
+def instrument_engine(engine: Engine) -> None:
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine, "commit", _on_transaction_end)
+    event.listen(engine, "rollback", _on_transaction_end)
+
+
+class QueryBudgetMiddleware:
+    """
+    Tesztekhez: kérésenként megszámolja az SQL utasításokat és köröket
+    (a függőségek, pl. `get_current_user` lekérdezéseit is), és
+    `QueryBudgetExceeded` hibát dob, ha a végpont túllépi a keretét.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        with track_queries() as log:
+            await self.app(scope, receive, send)
+
+        # A router a feloldott végpontot beírja a scope-ba
+        endpoint = scope.get("endpoint")
+        budget = getattr(endpoint, "__query_budget__", None)
+        if budget is None:
+            return
+
+        if len(log.statements) > budget.statements or log.round_trips > budget.round_trips:
+            raise QueryBudgetExceeded(
+                f"{scope['method']} {scope['path']} ({endpoint.__name__})", budget, log
+            )
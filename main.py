@@ -1,7 +1,9 @@
+import os
 from fastapi import FastAPI
 from contextlib import asynccontextmanager
 from routers import user, appointment
 from dependencies.database import Base, engine
+from dependencies.query_budget import QueryBudgetMiddleware
 from fastapi.middleware.cors import CORSMiddleware
 
 app = FastAPI()
@@ -27,6 +29,10 @@ async def lifespan(app: FastAPI):
 
 app = FastAPI(lifespan=lifespan)
 
+# Tesztek alatt a végpontok lekérdezési keretét ellenőrizzük
+if os.getenv("QUERY_BUDGET_CHECK", "False").lower() in ("true", "1", "t"):
+    app.add_middleware(QueryBudgetMiddleware)
+
 app.include_router(user.router, prefix="/auth", tags=["Authentication"])
 app.include_router(appointment.router, prefix="/api", tags=["Appointments"])
 
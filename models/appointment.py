@@ -10,6 +10,6 @@ class Appointment(Base):
     id: Mapped[int] = mapped_column(primary_key = True, index = True)
     name: Mapped[str] = mapped_column(index = True)
     start_time: Mapped[datetime] = mapped_column(DateTime(timezone = True), nullable = False)
-    user_id: Mapped[int] = mapped_column(ForeignKey("users.id"), nullable = False)
+    user_id: Mapped[int] = mapped_column(ForeignKey("users.id"), nullable = False, index = True)
     user: Mapped["User"] = relationship(back_populates = "appointments")
     __table_args__ = (UniqueConstraint("start_time", name = "unique_start_time"),)
\ No newline at end of file
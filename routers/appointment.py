@@ -7,6 +7,7 @@ from models.appointment import Appointment
 from models.user import User
 from schemas.appointment import AppointmentCreate, AppointmentOut, PublicAppointmentOut
 from dependencies.database import get_db
+from dependencies.query_budget import query_budget
 from dependencies.auth import get_current_user
 from datetime import datetime, timedelta, timezone
 from fastapi_mail import FastMail, MessageSchema
@@ -23,6 +24,7 @@ load_dotenv()
     response_model=AppointmentOut,
     status_code=status.HTTP_201_CREATED,
 )
+@query_budget(statements=2, round_trips=3)
 async def book_appointment(
     appointment: AppointmentCreate,
     background_tasks: BackgroundTasks,
@@ -81,6 +83,7 @@ async def book_appointment(
     status_code=status.HTTP_204_NO_CONTENT,
     summary="Időpont törlése",
 )
+@query_budget(statements=3, round_trips=4)
 async def delete_appointment(
     appointment_id: int,
     db: AsyncSession = Depends(get_db),
@@ -126,6 +129,7 @@ async def delete_appointment(
     response_model=list[PublicAppointmentOut],
     summary="Minden foglalt időpont listázása (publikus)",
 )
+@query_budget(statements=1, round_trips=2)
 async def get_all_booked_appointments(db: AsyncSession = Depends(get_db)):
     result = await db.execute(select(Appointment).order_by(Appointment.start_time))
     appointments = result.scalars().all()
@@ -139,6 +143,7 @@ async def get_all_booked_appointments(db: AsyncSession = Depends(get_db)):
     response_model=list[AppointmentOut],
     summary="Saját időpontok listázása (bejelentkezés szükséges)",
 )
+@query_budget(statements=2, round_trips=3)
 async def get_my_appointments(
     db: AsyncSession = Depends(get_db), current_user: User = Depends(get_current_user)
 ):
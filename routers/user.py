@@ -1,11 +1,14 @@
-from fastapi import APIRouter, Depends, HTTPException, status, BackgroundTasks
+from typing import Optional
+from fastapi import APIRouter, Depends, HTTPException, status, BackgroundTasks, Query
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import select, func, or_
 from pydantic import BaseModel
 from models.user import User
+from models.appointment import Appointment
 from dependencies.database import get_db
-from dependencies.auth import get_current_user
-from schemas.user import ( UserCreate, UserLogin, UserOut, UserUpdate, PasswordUpdate, PasswordResetRequest, PasswordReset )
+from dependencies.query_budget import query_budget
+from dependencies.auth import get_current_user, get_current_admin_user
+from schemas.user import ( UserCreate, UserLogin, UserOut, UserUpdate, PasswordUpdate, PasswordResetRequest, PasswordReset, UserAdminOut, UserListOut )
 from services.auth import (
     hash_password, verify_password, create_access_token, create_password_reset_token, verify_password_reset_token
 )
@@ -19,6 +22,7 @@ class Token(BaseModel):
     token_type: str
 
 @router.post("/register", response_model=UserOut, status_code=status.HTTP_201_CREATED,)
+@query_budget(statements=3, round_trips=5)
 
 async def register(user: UserCreate, db: AsyncSession = Depends(get_db)):
     result = await db.execute(select(User).where(User.email == user.email))
@@ -43,6 +47,7 @@ async def register(user: UserCreate, db: AsyncSession = Depends(get_db)):
 
 
 @router.post("/login", response_model=Token)
+@query_budget(statements=1, round_trips=2)
 
 async def login(user: UserLogin, db: AsyncSession = Depends(get_db)):
     result = await db.execute(select(User).where(User.email == user.email))
@@ -61,11 +66,62 @@ async def login(user: UserLogin, db: AsyncSession = Depends(get_db)):
     return {"access_token": token, "token_type": "bearer"}
 
 
+@router.get("/users", response_model=UserListOut, summary="Felhasználók listázása (admin)")
+@query_budget(statements=2, round_trips=3)
+async def list_users(
+    search: Optional[str] = Query(None, min_length=1, description="Név vagy e-mail cím eleje"),
+    after_id: Optional[int] = Query(None, description="Az előző oldal next_cursor értéke"),
+    limit: int = Query(20, ge=1, le=100),
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_admin_user),
+):
+    # Egyetlen lekérdezés: a foglalások számát aggregálva kérjük le,
+    # a User.appointments kollekciókat nem töltjük be.
+    query = (
+        select(
+            User.id,
+            User.name,
+            User.email,
+            User.phone_number,
+            User.is_superuser,
+            func.count(Appointment.id).label("appointment_count"),
+        )
+        .outerjoin(Appointment, Appointment.user_id == User.id)
+        .group_by(User.id)
+        .order_by(User.id)
+        # Eggyel többet kérünk le, így tudjuk, van-e következő oldal
+        .limit(limit + 1)
+    )
+
+    # Kis- és nagybetűtől független prefix keresés (Postgresen ILIKE, máshol
+    # lower() LIKE), így minden adatbázison ugyanúgy viselkedik. A name és
+    # email indexeket ez nem használja, a users táblát végigolvassa.
+    if search:
+        query = query.where(
+            or_(
+                User.name.istartswith(search, autoescape=True),
+                User.email.istartswith(search, autoescape=True),
+            )
+        )
+
+    # Keyset lapozás: az utolsó látott id utáni sorok, OFFSET nélkül
+    if after_id is not None:
+        query = query.where(User.id > after_id)
+
+    result = await db.execute(query)
+    rows = result.all()
+
+    items = [UserAdminOut.model_validate(row) for row in rows[:limit]]
+    next_cursor = items[-1].id if len(rows) > limit else None
+    return {"items": items, "next_cursor": next_cursor}
+
+
 @router.delete(
     "/users/{user_id}",
     status_code = status.HTTP_204_NO_CONTENT,
     summary = "Delete user"
 )
+@query_budget(statements=5, round_trips=6)
 async def delete_user(
     user_id: int,
     db: AsyncSession = Depends(get_db),
@@ -90,6 +146,7 @@ async def delete_user(
     await db.commit()
 
 @router.patch("/users/{user_id}", response_model=UserOut, summary="Felhasználói profil módosítása")
+@query_budget(statements=5, round_trips=7)
 async def update_user_profile(
     user_id: int,
     user_update: UserUpdate,
@@ -123,6 +180,7 @@ async def update_user_profile(
     return db_user
 
 @router.put("/users/{user_id}/password", status_code=status.HTTP_204_NO_CONTENT, summary="Jelszó módosítása")
+@query_budget(statements=3, round_trips=4)
 async def update_password(
     user_id: int,
     password_update: PasswordUpdate,
@@ -152,6 +210,7 @@ async def update_password(
 
 # --- ÚJ VÉGPONT: Elfelejtett jelszó - Token kérése ---
 @router.post("/forgot-password", summary="Jelszó-visszaállító token kérése")
+@query_budget(statements=1, round_trips=2)
 async def request_password_reset(
     request: PasswordResetRequest, 
     background_tasks: BackgroundTasks,
@@ -178,13 +237,14 @@ async def request_password_reset(
         
         fm = FastMail(conf)
         # Email küldés a háttérben
-        background_tasks.add_task(fm.send_message, message)
+        background_tasks.add_task(fm.send_message, message, template_name="password_reset.html")
         
     return {"message": "Ha létezik ilyen e-mail cím, elküldtük a visszaállításhoz szükséges utasításokat."}
 
 
 # --- ÚJ VÉGPONT: Elfelejtett jelszó - Új jelszó beállítása ---
 @router.post("/reset-password", summary="Jelszó visszaállítása token segítségével")
+@query_budget(statements=2, round_trips=3)
 async def reset_password(
     password_reset: PasswordReset,
     db: AsyncSession = Depends(get_db)
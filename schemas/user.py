@@ -21,7 +21,7 @@ def validate_password_strength(v: str) -> str:
 class UserBase(BaseModel):
     name: str
     email: EmailStr
-    phone_number: str = None
+    phone_number: Optional[str] = None
 
 class UserCreate(UserBase):
     password: str = Field(
@@ -44,6 +44,13 @@ class UserOut(UserBase):
 
     model_config = {"from_attributes": True}
 
+class UserAdminOut(UserOut):
+    appointment_count: int
+
+class UserListOut(BaseModel):
+    items: list[UserAdminOut]
+    next_cursor: Optional[int] = None
+
 class UserUpdate(BaseModel):
     name: Optional[str] = None
     email: Optional[EmailStr] = None
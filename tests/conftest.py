@@ -0,0 +1,67 @@
+import os
+import tempfile
+
+# A környezeti változókat a `main` importálása előtt kell beállítani,
+# mert a database és email modulok importáláskor olvassák őket.
+_db_dir = tempfile.mkdtemp()
+os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(_db_dir, 'test.db')}"
+os.environ["QUERY_BUDGET_CHECK"] = "1"
+os.environ["SUPPRESS_SEND"] = "1"
+os.environ.setdefault("MAIL_USERNAME", "test")
+os.environ.setdefault("MAIL_PASSWORD", "test")
+os.environ.setdefault("MAIL_FROM", "noreply@example.com")
+os.environ.setdefault("MAIL_SERVER", "localhost")
+os.environ.setdefault("NAIL_TECHNICIAN_EMAIL", "technician@example.com")
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import update
+
+from main import app
+from dependencies.database import Base, engine
+from models.user import User
+
+PASSWORD = "Jelszo123!"
+
+
+async def _reset_db():
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+        await conn.run_sync(Base.metadata.create_all)
+
+
+@pytest.fixture
+def client():
+    with TestClient(app) as c:
+        c.portal.call(_reset_db)
+        yield c
+        # A kapcsolatok a TestClient eseményhurkához tartoznak
+        c.portal.call(engine.dispose)
+
+
+@pytest.fixture
+def create_user(client):
+    """
+    Regisztrál egy felhasználót, és visszaadja az azonosítóját
+    valamint a bejelentkezéshez tartozó Authorization fejlécet.
+    """
+    def _create_user(email, name="Teszt Elek", phone_number="+36301234567", is_superuser=False):
+        payload = {"name": name, "email": email, "password": PASSWORD}
+        if phone_number is not None:
+            payload["phone_number"] = phone_number
+        response = client.post("/auth/register", json=payload)
+        assert response.status_code == 201, response.text
+        user_id = response.json()["id"]
+
+        if is_superuser:
+            async def _promote():
+                async with engine.begin() as conn:
+                    await conn.execute(update(User).where(User.id == user_id).values(is_superuser=True))
+
+            client.portal.call(_promote)
+
+        response = client.post("/auth/login", json={"email": email, "password": PASSWORD})
+        assert response.status_code == 200, response.text
+        return user_id, {"Authorization": f"Bearer {response.json()['access_token']}"}
+
+    return _create_user
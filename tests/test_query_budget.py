@@ -0,0 +1,140 @@
+import pytest
+
+from dependencies.query_budget import QueryBudget, QueryBudgetExceeded
+from routers.appointment import get_all_booked_appointments
+from services.auth import create_password_reset_token
+
+PASSWORD = "Jelszo123!"
+
+# A QUERY_BUDGET_CHECK be van kapcsolva (conftest), így ha egy végpont
+# túllépi a @query_budget keretét, a kérés QueryBudgetExceeded hibát dob.
+
+
+def _book(client, headers, start_time="2030-01-01T10:00:00"):
+    return client.post(
+        "/api/appointments", json={"name": "Manikűr", "start_time": start_time}, headers=headers
+    )
+
+
+def test_register(client):
+    response = client.post(
+        "/auth/register",
+        json={
+            "name": "Teszt Elek",
+            "email": "elek@example.com",
+            "password": PASSWORD,
+            "phone_number": "+36301234567",
+        },
+    )
+    assert response.status_code == 201
+
+
+def test_login(client, create_user):
+    create_user("elek@example.com")
+    response = client.post("/auth/login", json={"email": "elek@example.com", "password": PASSWORD})
+    assert response.status_code == 200
+
+
+def test_update_user_profile_email_change(client, create_user):
+    user_id, headers = create_user("elek@example.com")
+    response = client.patch(
+        f"/auth/users/{user_id}",
+        json={"name": "Új Név", "email": "uj@example.com"},
+        headers=headers,
+    )
+    assert response.status_code == 200
+    assert response.json()["email"] == "uj@example.com"
+
+
+def test_update_user_profile_email_taken(client, create_user):
+    create_user("foglalt@example.com")
+    user_id, headers = create_user("elek@example.com")
+    response = client.patch(
+        f"/auth/users/{user_id}", json={"email": "foglalt@example.com"}, headers=headers
+    )
+    assert response.status_code == 409
+
+
+def test_update_password(client, create_user):
+    user_id, headers = create_user("elek@example.com")
+    response = client.put(
+        f"/auth/users/{user_id}/password",
+        json={"current_password": PASSWORD, "new_password": "UjJelszo456!"},
+        headers=headers,
+    )
+    assert response.status_code == 204
+
+
+def test_request_password_reset(client, create_user):
+    create_user("elek@example.com")
+    response = client.post("/auth/forgot-password", json={"email": "elek@example.com"})
+    assert response.status_code == 200
+
+
+def test_reset_password(client, create_user):
+    create_user("elek@example.com")
+    response = client.post(
+        "/auth/reset-password",
+        json={
+            "token": create_password_reset_token("elek@example.com"),
+            "new_password": "UjJelszo456!",
+        },
+    )
+    assert response.status_code == 200
+
+
+def test_delete_user_with_appointments(client, create_user):
+    user_id, headers = create_user("elek@example.com")
+    for day in range(1, 4):
+        assert _book(client, headers, f"2030-01-0{day}T10:00:00").status_code == 201
+
+    response = client.delete(f"/auth/users/{user_id}", headers=headers)
+    assert response.status_code == 204
+
+
+def test_book_appointment(client, create_user):
+    _, headers = create_user("elek@example.com")
+    assert _book(client, headers).status_code == 201
+
+
+def test_book_appointment_conflict(client, create_user):
+    _, headers = create_user("elek@example.com")
+    assert _book(client, headers).status_code == 201
+    assert _book(client, headers).status_code == 409
+
+
+def test_delete_appointment(client, create_user):
+    _, headers = create_user("elek@example.com")
+    appointment_id = _book(client, headers).json()["id"]
+    response = client.delete(f"/api/appointments/{appointment_id}", headers=headers)
+    assert response.status_code == 204
+
+
+def test_get_all_booked_appointments(client, create_user):
+    _, headers = create_user("elek@example.com")
+    _book(client, headers)
+    response = client.get("/api/appointments/public")
+    assert response.status_code == 200
+    assert len(response.json()) == 1
+
+
+def test_get_my_appointments(client, create_user):
+    _, headers = create_user("elek@example.com")
+    _book(client, headers)
+    response = client.get("/api/appointments/me", headers=headers)
+    assert response.status_code == 200
+    assert len(response.json()) == 1
+
+
+def test_budget_exceeded_reports_queries(client, monkeypatch):
+    monkeypatch.setattr(
+        get_all_booked_appointments, "__query_budget__", QueryBudget(statements=0, round_trips=0)
+    )
+
+    with pytest.raises(QueryBudgetExceeded) as exc_info:
+        client.get("/api/appointments/public")
+
+    error = exc_info.value
+    assert len(error.log.statements) == 1
+    assert "get_all_booked_appointments" in str(error)
+    assert "FROM appointments ORDER BY appointments.start_time" in str(error)
@@ -0,0 +1,134 @@
+import pytest
+
+from dependencies.query_budget import QueryBudget, QueryBudgetExceeded
+from routers.user import list_users
+
+
+@pytest.fixture
+def admin_headers(create_user):
+    _, headers = create_user("admin@example.com", name="Admin", is_superuser=True)
+    return headers
+
+
+def _emails(response):
+    assert response.status_code == 200, response.text
+    return [user["email"] for user in response.json()["items"]]
+
+
+def test_list_users_requires_admin(client, create_user):
+    _, headers = create_user("elek@example.com")
+    response = client.get("/auth/users", headers=headers)
+    assert response.status_code == 403
+
+
+def test_list_users_user_without_phone_number(client, create_user, admin_headers):
+    create_user("elek@example.com", phone_number=None)
+    response = client.get("/auth/users", headers=admin_headers)
+    assert response.status_code == 200
+    users = {user["email"]: user for user in response.json()["items"]}
+    assert users["elek@example.com"]["phone_number"] is None
+
+
+def test_list_users_keyset_pagination(client, create_user, admin_headers):
+    for i in range(4):
+        create_user(f"user{i}@example.com")
+
+    response = client.get("/auth/users", params={"limit": 2}, headers=admin_headers)
+    first_page = response.json()
+    assert _emails(response) == ["admin@example.com", "user0@example.com"]
+    assert first_page["next_cursor"] == first_page["items"][-1]["id"]
+
+    response = client.get(
+        "/auth/users",
+        params={"limit": 2, "after_id": first_page["next_cursor"]},
+        headers=admin_headers,
+    )
+    second_page = response.json()
+    assert _emails(response) == ["user1@example.com", "user2@example.com"]
+
+    response = client.get(
+        "/auth/users",
+        params={"limit": 2, "after_id": second_page["next_cursor"]},
+        headers=admin_headers,
+    )
+    assert _emails(response) == ["user3@example.com"]
+    assert response.json()["next_cursor"] is None
+
+
+def test_list_users_exact_last_page_has_no_cursor(client, create_user, admin_headers):
+    create_user("elek@example.com")
+    response = client.get("/auth/users", params={"limit": 2}, headers=admin_headers)
+    assert len(response.json()["items"]) == 2
+    assert response.json()["next_cursor"] is None
+
+
+def test_list_users_search_by_name_and_email(client, create_user, admin_headers):
+    create_user("anna@example.com", name="Kovács Anna")
+    create_user("kovacs.bela@example.com", name="Nagy Béla")
+    create_user("cili@example.com", name="Szabó Cili")
+
+    response = client.get("/auth/users", params={"search": "kov"}, headers=admin_headers)
+    assert _emails(response) == ["anna@example.com", "kovacs.bela@example.com"]
+
+    response = client.get("/auth/users", params={"search": "anna@"}, headers=admin_headers)
+    assert _emails(response) == ["anna@example.com"]
+
+    # Csak a név/e-mail elejére keres, a közepére nem
+    response = client.get("/auth/users", params={"search": "cili@"}, headers=admin_headers)
+    assert _emails(response) == ["cili@example.com"]
+    response = client.get("/auth/users", params={"search": "Cili"}, headers=admin_headers)
+    assert _emails(response) == ["cili@example.com"]
+    response = client.get("/auth/users", params={"search": "abó"}, headers=admin_headers)
+    assert _emails(response) == []
+
+
+def test_list_users_search_escapes_wildcards(client, create_user, admin_headers):
+    create_user("a_b@example.com", name="Aláhúzás")
+    create_user("axb@example.com", name="Betű")
+    create_user("szazalek@example.com", name="100% Elégedett")
+    create_user("ezer@example.com", name="1000 Forint")
+
+    response = client.get("/auth/users", params={"search": "a_"}, headers=admin_headers)
+    assert _emails(response) == ["a_b@example.com"]
+
+    response = client.get("/auth/users", params={"search": "100%"}, headers=admin_headers)
+    assert _emails(response) == ["szazalek@example.com"]
+
+
+def test_list_users_appointment_counts(client, create_user, admin_headers):
+    _, headers = create_user("elek@example.com")
+    create_user("anna@example.com")
+    for day in range(1, 4):
+        response = client.post(
+            "/api/appointments",
+            json={"name": "Manikűr", "start_time": f"2030-01-0{day}T10:00:00"},
+            headers=headers,
+        )
+        assert response.status_code == 201
+
+    response = client.get("/auth/users", headers=admin_headers)
+    counts = {user["email"]: user["appointment_count"] for user in response.json()["items"]}
+    assert counts == {"admin@example.com": 0, "elek@example.com": 3, "anna@example.com": 0}
+
+
+def test_list_users_query_budget(client, create_user, admin_headers, monkeypatch):
+    _, headers = create_user("elek@example.com")
+    client.post(
+        "/api/appointments",
+        json={"name": "Manikűr", "start_time": "2030-01-01T10:00:00"},
+        headers=headers,
+    )
+    assert list_users.__query_budget__ == QueryBudget(statements=2, round_trips=3)
+
+    # Kereséssel és lapozással is belefér a keretbe (a middleware különben hibát dobna)
+    response = client.get(
+        "/auth/users", params={"search": "e", "after_id": 1, "limit": 1}, headers=admin_headers
+    )
+    assert response.status_code == 200
+
+    # Egy utasítással kevesebb már nem elég: a hitelesítés és a listázás két lekérdezés
+    monkeypatch.setattr(list_users, "__query_budget__", QueryBudget(statements=1, round_trips=3))
+    with pytest.raises(QueryBudgetExceeded) as exc_info:
+        client.get("/auth/users", headers=admin_headers)
+    assert len(exc_info.value.log.statements) == 2
+    assert "count(appointments.id)" in str(exc_info.value)